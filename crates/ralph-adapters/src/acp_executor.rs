@@ -291,7 +291,9 @@ impl agent_client_protocol::Client for RalphAcpClient {
                     return Ok(());
                 }
 
-                let input = tc.raw_input.clone().unwrap_or_else(|| {
+                // The notification is owned, so move its fields out rather
+                // than cloning the (potentially large) raw input JSON.
+                let input = tc.raw_input.unwrap_or_else(|| {
                     if let Some(loc) = tc.locations.first() {
                         serde_json::json!({"path": loc.path.display().to_string()})
                     } else {
@@ -299,7 +301,7 @@ impl agent_client_protocol::Client for RalphAcpClient {
                     }
                 });
                 let _ = self.tx.send(AcpEvent::ToolCall {
-                    name: tc.title.clone(),
+                    name: tc.title,
                     id: tc.tool_call_id.to_string(),
                     input,
                 });
@@ -310,21 +312,19 @@ impl agent_client_protocol::Client for RalphAcpClient {
                     let output = update
                         .fields
                         .content
-                        .as_ref()
-                        .and_then(|c| {
-                            c.iter().find_map(|block| {
-                                if let agent_client_protocol::ToolCallContent::Content(content) =
-                                    block
-                                    && let ContentBlock::Text(t) = &content.content
-                                {
-                                    return Some(t.text.clone());
-                                }
-                                None
-                            })
+                        .into_iter()
+                        .flatten()
+                        .find_map(|block| {
+                            if let agent_client_protocol::ToolCallContent::Content(content) = block
+                                && let ContentBlock::Text(t) = content.content
+                            {
+                                return Some(t.text);
+                            }
+                            None
                         })
                         .or_else(|| {
-                            update.fields.raw_output.as_ref().map(|v| match v {
-                                serde_json::Value::String(s) => s.clone(),
+                            update.fields.raw_output.map(|v| match v {
+                                serde_json::Value::String(s) => s,
                                 other => other.to_string(),
                             })
                         })
@@ -336,16 +336,16 @@ impl agent_client_protocol::Client for RalphAcpClient {
                 }
             }
             SessionUpdate::Plan(plan) => {
-                let text = plan
-                    .entries
-                    .iter()
-                    .map(|e| format!("- {}", e.content))
-                    .collect::<Vec<_>>()
-                    .join("\n");
-                if !text.is_empty() {
-                    let _ = self
-                        .tx
-                        .send(AcpEvent::Text(format!("\n## Plan\n{}\n", text)));
+                if !plan.entries.is_empty() {
+                    // Render straight into one buffer instead of formatting
+                    // each entry, collecting, joining and formatting again.
+                    let mut text = String::from("\n## Plan\n");
+                    for entry in &plan.entries {
+                        text.push_str("- ");
+                        text.push_str(&entry.content);
+                        text.push('\n');
+                    }
+                    let _ = self.tx.send(AcpEvent::Text(text));
                 }
             }
             _ => {}
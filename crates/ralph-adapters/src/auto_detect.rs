@@ -3,8 +3,9 @@
 //! When config specifies `agent: auto`, this module handles detecting
 //! which backends are available in the system PATH.
 
+use std::collections::HashMap;
 use std::process::Command;
-use std::sync::OnceLock;
+use std::sync::{Mutex, OnceLock};
 use tracing::debug;
 
 /// Default priority order for backend detection.
@@ -27,6 +28,9 @@ fn detection_command(backend: &str) -> &str {
 /// Cached detection result for session duration.
 static DETECTED_BACKEND: OnceLock<Option<String>> = OnceLock::new();
 
+/// Cached `<command> --version` probe results, keyed by command name.
+static COMMAND_AVAILABILITY: OnceLock<Mutex<HashMap<String, bool>>> = OnceLock::new();
+
 /// Error returned when no backends are available.
 #[derive(Debug, Clone)]
 pub struct NoBackendError {
@@ -77,8 +81,28 @@ impl std::error::Error for NoBackendError {}
 /// Each backend is detected by running `<command> --version` and checking
 /// for exit code 0. The command may differ from the backend name (e.g.,
 /// "kiro" backend uses "kiro-cli" command).
+///
+/// Results are cached per command for the session, so repeated checks
+/// (e.g. "kiro" and "kiro-acp" both probing `kiro-cli`) spawn at most once.
 pub fn is_backend_available(backend: &str) -> bool {
     let command = detection_command(backend);
+    let cache = COMMAND_AVAILABILITY.get_or_init(|| Mutex::new(HashMap::new()));
+
+    if let Ok(cached) = cache.lock()
+        && let Some(&available) = cached.get(command)
+    {
+        return available;
+    }
+
+    let available = probe_command(backend, command);
+    if let Ok(mut cached) = cache.lock() {
+        cached.insert(command.to_string(), available);
+    }
+    available
+}
+
+/// Runs `<command> --version` and reports whether it exited successfully.
+fn probe_command(backend: &str, command: &str) -> bool {
     let result = Command::new(command).arg("--version").output();
 
     match result {
@@ -178,6 +202,16 @@ mod tests {
         ));
     }
 
+    #[test]
+    fn test_is_backend_available_caches_probe_result() {
+        let backend = "definitely_not_a_real_command_cache_xyz";
+        assert!(!is_backend_available(backend));
+
+        let cache = COMMAND_AVAILABILITY.get().expect("cache initialized");
+        assert_eq!(cache.lock().unwrap().get(backend).copied(), Some(false));
+        assert!(!is_backend_available(backend));
+    }
+
     #[test]
     fn test_detect_backend_with_disabled_adapters() {
         // All adapters disabled should fail
@@ -105,6 +105,13 @@ impl ClaudeStreamParser {
             return None;
         }
 
+        // Every event is a JSON object; skip banners and other plain-text
+        // output without running the JSON parser.
+        if !trimmed.starts_with('{') {
+            tracing::debug!("Skipping non-JSON line: {}", truncate(trimmed, 100));
+            return None;
+        }
+
         match serde_json::from_str::<ClaudeStreamEvent>(trimmed) {
             Ok(event) => Some(event),
             Err(e) => {
@@ -286,6 +293,7 @@ mod tests {
     fn test_parse_malformed_json() {
         assert!(ClaudeStreamParser::parse_line("{not valid json}").is_none());
         assert!(ClaudeStreamParser::parse_line("plain text").is_none());
+        assert!(ClaudeStreamParser::parse_line("[1, 2]").is_none());
         assert!(ClaudeStreamParser::parse_line("{\"type\":\"unknown\"}").is_none());
     }
 
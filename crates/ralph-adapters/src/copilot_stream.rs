@@ -183,6 +183,13 @@ impl CopilotStreamParser {
             return None;
         }
 
+        // Every event is a JSON object; skip banners and other plain-text
+        // output without running the JSON parser.
+        if !trimmed.starts_with('{') {
+            tracing::debug!("Skipping non-JSON line: {}", truncate(trimmed, 100));
+            return None;
+        }
+
         let value = match serde_json::from_str::<Value>(trimmed) {
             Ok(value) => value,
             Err(e) => {
@@ -607,6 +614,14 @@ mod tests {
         }
     }
 
+    #[test]
+    fn test_parse_non_event_lines() {
+        assert!(CopilotStreamParser::parse_line("").is_none());
+        assert!(CopilotStreamParser::parse_line("plain text").is_none());
+        assert!(CopilotStreamParser::parse_line("[1, 2]").is_none());
+        assert!(CopilotStreamParser::parse_line("{not valid json}").is_none());
+    }
+
     #[test]
     fn test_parse_assistant_message_content() {
         let line = r#"{"type":"assistant.message","data":{"messageId":"msg-1","content":"hello world","toolRequests":[]}}"#;
@@ -131,6 +131,13 @@ impl PiStreamParser {
             return None;
         }
 
+        // Every event is a JSON object; skip banners and other plain-text
+        // output without running the JSON parser.
+        if !trimmed.starts_with('{') {
+            tracing::debug!("Skipping non-JSON line: {}", truncate(trimmed, 100));
+            return None;
+        }
+
         match serde_json::from_str::<PiStreamEvent>(trimmed) {
             Ok(event) => Some(event),
             Err(e) => {
@@ -494,6 +501,7 @@ mod tests {
     fn test_parse_malformed_json() {
         assert!(PiStreamParser::parse_line("{not valid json}").is_none());
         assert!(PiStreamParser::parse_line("plain text").is_none());
+        assert!(PiStreamParser::parse_line("[1, 2]").is_none());
     }
 
     #[test]
@@ -79,9 +79,11 @@ event_loop:
     )
 }
 
+/// Config file name written by `ralph init`.
+const CONFIG_FILE: &str = "ralph.yml";
+
 /// Checks if ralph.yml exists and handles the force flag.
-fn check_file_exists(force: bool) -> Result<(), InitError> {
-    let path = Path::new("ralph.yml");
+fn check_file_exists(path: &Path, force: bool) -> Result<(), InitError> {
     if path.exists() && !force {
         return Err(InitError::FileExists);
     }
@@ -91,12 +93,13 @@ fn check_file_exists(force: bool) -> Result<(), InitError> {
 /// Initializes ralph.yml from a minimal backend template.
 ///
 /// # Arguments
+/// * `root` - Directory to write ralph.yml into
 /// * `backend` - The backend name (claude, kiro, gemini, codex, forge, amp, copilot, opencode, pi, custom)
 /// * `force` - If true, overwrite existing ralph.yml
 ///
 /// # Errors
 /// Returns error if file exists (without force) or backend is invalid.
-pub fn init_from_backend(backend: &str, force: bool) -> Result<(), InitError> {
+pub fn init_from_backend(root: &Path, backend: &str, force: bool) -> Result<(), InitError> {
     // Validate backend
     if !VALID_BACKENDS.contains(&backend) {
         return Err(InitError::UnknownBackend(
@@ -104,10 +107,11 @@ pub fn init_from_backend(backend: &str, force: bool) -> Result<(), InitError> {
         ));
     }
 
-    check_file_exists(force)?;
+    let config_path = root.join(CONFIG_FILE);
+    check_file_exists(&config_path, force)?;
 
     let content = generate_template(backend);
-    fs::write("ralph.yml", content)?;
+    fs::write(config_path, content)?;
 
     Ok(())
 }
@@ -115,6 +119,7 @@ pub fn init_from_backend(backend: &str, force: bool) -> Result<(), InitError> {
 /// Initializes ralph.yml from an embedded preset.
 ///
 /// # Arguments
+/// * `root` - Directory to write ralph.yml into
 /// * `preset_name` - The name of the preset to use
 /// * `backend_override` - Optional backend to override the preset's backend
 /// * `force` - If true, overwrite existing ralph.yml
@@ -123,6 +128,7 @@ pub fn init_from_backend(backend: &str, force: bool) -> Result<(), InitError> {
 /// Returns error if file exists (without force) or preset doesn't exist.
 #[cfg(test)]
 pub fn init_from_preset(
+    root: &Path,
     preset_name: &str,
     backend_override: Option<&str>,
     force: bool,
@@ -141,7 +147,8 @@ pub fn init_from_preset(
         ));
     }
 
-    check_file_exists(force)?;
+    let config_path = root.join(CONFIG_FILE);
+    check_file_exists(&config_path, force)?;
 
     let content = if let Some(backend) = backend_override {
         override_backend_in_yaml(preset.content, backend)?
@@ -149,7 +156,7 @@ pub fn init_from_preset(
         preset.content.to_string()
     };
 
-    fs::write("ralph.yml", content)?;
+    fs::write(config_path, content)?;
 
     Ok(())
 }
@@ -215,7 +222,6 @@ pub fn format_preset_list() -> String {
 #[cfg(test)]
 mod tests {
     use super::*;
-    use crate::test_support::CwdGuard;
     use tempfile::TempDir;
 
     #[test]
@@ -268,28 +274,45 @@ mod tests {
     #[test]
     fn test_init_from_preset_code_assist_writes_config() {
         let temp_dir = TempDir::new().expect("create temp dir");
-        let _cwd = CwdGuard::set(temp_dir.path());
 
-        init_from_preset("code-assist", None, false).expect("init_from_preset succeeds");
+        init_from_preset(temp_dir.path(), "code-assist", None, false)
+            .expect("init_from_preset succeeds");
 
-        let content = fs::read_to_string("ralph.yml").expect("read ralph.yml");
+        let content =
+            fs::read_to_string(temp_dir.path().join("ralph.yml")).expect("read ralph.yml");
         assert!(
             content.contains("build.start") && content.contains("LOOP_COMPLETE"),
             "expected event loop configuration in generated config"
         );
     }
 
+    #[test]
+    fn test_init_from_backend_writes_config_and_respects_force() {
+        let temp_dir = TempDir::new().expect("create temp dir");
+
+        init_from_backend(temp_dir.path(), "claude", false).expect("init succeeds");
+        let content =
+            fs::read_to_string(temp_dir.path().join("ralph.yml")).expect("read ralph.yml");
+        assert!(content.contains("backend: \"claude\""));
+
+        let result = init_from_backend(temp_dir.path(), "kiro", false);
+        assert!(matches!(result, Err(InitError::FileExists)));
+
+        init_from_backend(temp_dir.path(), "kiro", true).expect("forced init succeeds");
+        let content =
+            fs::read_to_string(temp_dir.path().join("ralph.yml")).expect("read ralph.yml");
+        assert!(content.contains("backend: \"kiro\""));
+    }
+
     #[test]
     fn test_unknown_backend_error() {
-        // We can't actually test file operations without filesystem mocking,
-        // but we can test the validation logic
-        let result = init_from_backend("invalid-backend", false);
+        let result = init_from_backend(Path::new("."), "invalid-backend", false);
         assert!(matches!(result, Err(InitError::UnknownBackend(_))));
     }
 
     #[test]
     fn test_unknown_backend_message_actionable() {
-        let result = init_from_backend("invalid-backend", false);
+        let result = init_from_backend(Path::new("."), "invalid-backend", false);
         assert!(result.is_err());
 
         let err = result.expect_err("expected init error");
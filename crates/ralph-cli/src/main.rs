@@ -2282,7 +2282,7 @@ fn init_command(color_mode: ColorMode, args: InitArgs) -> Result<()> {
 
     // Handle --backend alone (minimal config)
     if let Some(backend) = args.backend {
-        match init::init_from_backend(&backend, args.force) {
+        match init::init_from_backend(Path::new("."), &backend, args.force) {
             Ok(()) => {
                 if use_colors {
                     println!(
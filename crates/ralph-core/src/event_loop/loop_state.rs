@@ -151,6 +151,20 @@ impl LoopState {
         }
     }
 
+    /// Record the outcome of a finished iteration in one step.
+    ///
+    /// Advances the iteration counter, remembers the hat that ran, and
+    /// resets or bumps the consecutive-failure counter.
+    pub fn commit_iteration(&mut self, hat: &HatId, success: bool) {
+        self.iteration += 1;
+        self.last_hat = Some(hat.clone());
+        self.consecutive_failures = if success {
+            0
+        } else {
+            self.consecutive_failures + 1
+        };
+    }
+
     /// Record this iteration's context-token usage for the hat that ran it.
     ///
     /// `tokens` is the iteration's adapter-reported live context occupancy.
@@ -216,6 +230,22 @@ mod tests {
         );
     }
 
+    #[test]
+    fn commit_iteration_updates_counters_together() {
+        let mut state = LoopState::new();
+        let builder = HatId::new("builder");
+
+        state.commit_iteration(&builder, false);
+        state.commit_iteration(&builder, false);
+        assert_eq!(state.iteration, 2);
+        assert_eq!(state.consecutive_failures, 2);
+        assert_eq!(state.last_hat.as_ref(), Some(&builder));
+
+        state.commit_iteration(&builder, true);
+        assert_eq!(state.iteration, 3);
+        assert_eq!(state.consecutive_failures, 0);
+    }
+
     #[test]
     fn record_iteration_tokens_tracks_per_hat_and_global_peak() {
         let mut state = LoopState::new();
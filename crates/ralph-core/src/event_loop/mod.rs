@@ -29,6 +29,9 @@ use std::sync::atomic::AtomicBool;
 use std::time::Duration;
 use tracing::{debug, info, warn};
 
+/// Checklist prefix marking a pending scratchpad task.
+const PENDING_TASK_MARKER: &str = "- [ ]";
+
 /// Result of processing events from JSONL.
 #[derive(Debug, Clone)]
 pub struct ProcessedEvents {
@@ -2011,8 +2014,7 @@ impl EventLoop {
         output: &str,
         success: bool,
     ) -> Option<TerminationReason> {
-        self.state.iteration += 1;
-        self.state.last_hat = Some(hat_id.clone());
+        self.state.commit_iteration(hat_id, success);
 
         // Periodic robot check-in
         if let Some(interval_secs) = self.config.robot.checkin_interval_seconds
@@ -2057,13 +2059,6 @@ impl EventLoop {
             },
         );
 
-        // Track failures
-        if success {
-            self.state.consecutive_failures = 0;
-        } else {
-            self.state.consecutive_failures += 1;
-        }
-
         let _ = output;
 
         // File-modification audit: detect when a hat with disallowed Edit/Write tools
@@ -2159,20 +2154,25 @@ impl EventLoop {
             return Ok(true);
         }
 
-        let scratchpad_path = self.scratchpad_path();
+        // Read directly instead of probing with `exists()` first; a missing
+        // file surfaces as NotFound from the open itself.
+        let content = std::fs::read_to_string(self.scratchpad_path()).map_err(|e| {
+            if e.kind() == std::io::ErrorKind::NotFound {
+                std::io::Error::new(std::io::ErrorKind::NotFound, "Scratchpad does not exist")
+            } else {
+                e
+            }
+        })?;
 
-        if !scratchpad_path.exists() {
-            return Err(std::io::Error::new(
-                std::io::ErrorKind::NotFound,
-                "Scratchpad does not exist",
-            ));
+        // Cheap substring pre-check: only pay for the per-line scan when the
+        // marker appears somewhere, since a match may still be mid-line.
+        if !content.contains(PENDING_TASK_MARKER) {
+            return Ok(true);
         }
 
-        let content = std::fs::read_to_string(scratchpad_path)?;
-
         let has_pending = content
             .lines()
-            .any(|line| line.trim_start().starts_with("- [ ]"));
+            .any(|line| line.trim_start().starts_with(PENDING_TASK_MARKER));
 
         Ok(!has_pending)
     }
@@ -3903,6 +3903,10 @@ fn test_verify_scratchpad_complete_variants() {
 
     fs::write(&scratchpad_path, "## Tasks\n- [x] Done\n- [~] Cancelled\n").unwrap();
     assert!(event_loop.verify_scratchpad_complete().unwrap());
+
+    // Marker text mid-line is not a pending task.
+    fs::write(&scratchpad_path, "## Notes\nUse `- [ ]` for open items\n").unwrap();
+    assert!(event_loop.verify_scratchpad_complete().unwrap());
 }
 
 #[test]
@@ -16,6 +16,7 @@
 
 use crate::file_lock::FileLock;
 use crate::task::{Task, TaskStatus};
+use std::collections::HashSet;
 use std::io;
 use std::path::Path;
 use tracing::warn;
@@ -42,6 +43,22 @@ fn parse_task_line(line: &str) -> Option<Task> {
     }
 }
 
+/// Serializes tasks as JSONL (one task per line, trailing newline) into a
+/// single buffer.
+fn serialize_tasks(tasks: &[Task]) -> io::Result<Vec<u8>> {
+    let mut buf = Vec::with_capacity(tasks.len() * 256);
+    for task in tasks {
+        serde_json::to_writer(&mut buf, task).map_err(|e| {
+            io::Error::new(
+                io::ErrorKind::InvalidData,
+                format!("task serialization failed: {e}"),
+            )
+        })?;
+        buf.push(b'\n');
+    }
+    Ok(buf)
+}
+
 impl TaskStore {
     /// Loads tasks from the JSONL file at the given path.
     ///
@@ -81,27 +98,7 @@ impl TaskStore {
         if let Some(parent) = self.path.parent() {
             std::fs::create_dir_all(parent)?;
         }
-        let content: String = self
-            .tasks
-            .iter()
-            .map(|t| {
-                serde_json::to_string(t).map_err(|e| {
-                    io::Error::new(
-                        io::ErrorKind::InvalidData,
-                        format!("task serialization failed: {e}"),
-                    )
-                })
-            })
-            .collect::<Result<Vec<_>, _>>()?
-            .join("\n");
-        std::fs::write(
-            &self.path,
-            if content.is_empty() {
-                String::new()
-            } else {
-                content + "\n"
-            },
-        )
+        std::fs::write(&self.path, serialize_tasks(&self.tasks)?)
     }
 
     /// Reloads tasks from disk, useful after external modifications.
@@ -164,27 +161,7 @@ impl TaskStore {
         if let Some(parent) = self.path.parent() {
             std::fs::create_dir_all(parent)?;
         }
-        let content: String = self
-            .tasks
-            .iter()
-            .map(|t| {
-                serde_json::to_string(t).map_err(|e| {
-                    io::Error::new(
-                        io::ErrorKind::InvalidData,
-                        format!("task serialization failed: {e}"),
-                    )
-                })
-            })
-            .collect::<Result<Vec<_>, _>>()?
-            .join("\n");
-        std::fs::write(
-            &self.path,
-            if content.is_empty() {
-                String::new()
-            } else {
-                content + "\n"
-            },
-        )?;
+        std::fs::write(&self.path, serialize_tasks(&self.tasks)?)?;
 
         Ok(result)
     }
@@ -296,10 +273,24 @@ impl TaskStore {
     }
 
     /// Returns all ready tasks (open with no pending blockers).
+    ///
+    /// Equivalent to filtering with [`Task::is_ready`], but resolves blockers
+    /// against a set of closed IDs built once instead of rescanning every
+    /// task for each blocker.
     pub fn ready(&self) -> Vec<&Task> {
+        let closed: HashSet<&str> = self
+            .tasks
+            .iter()
+            .filter(|t| t.status == TaskStatus::Closed)
+            .map(|t| t.id.as_str())
+            .collect();
+
         self.tasks
             .iter()
-            .filter(|t| t.is_ready(&self.tasks))
+            .filter(|t| {
+                t.status == TaskStatus::Open
+                    && t.blocked_by.iter().all(|id| closed.contains(id.as_str()))
+            })
             .collect()
     }
 
@@ -347,6 +338,26 @@ mod tests {
         assert_eq!(loaded.all()[0].title, "Test task");
     }
 
+    #[test]
+    fn test_save_writes_one_line_per_task() {
+        let tmp = TempDir::new().unwrap();
+        let path = tmp.path().join("tasks.jsonl");
+
+        let mut store = TaskStore::load(&path).unwrap();
+        store.save().unwrap();
+        assert_eq!(std::fs::read_to_string(&path).unwrap(), "");
+
+        store.add(Task::new("First".to_string(), 1));
+        store.add(Task::new("Second".to_string(), 2));
+        store.save().unwrap();
+
+        let content = std::fs::read_to_string(&path).unwrap();
+        assert!(content.ends_with('\n'));
+        let lines: Vec<&str> = content.lines().collect();
+        assert_eq!(lines.len(), 2);
+        assert_eq!(lines[0], serde_json::to_string(&store.all()[0]).unwrap());
+    }
+
     #[test]
     fn test_get_task() {
         let tmp = TempDir::new().unwrap();
@@ -450,6 +461,37 @@ mod tests {
         assert_eq!(ready[0].title, "Ready");
     }
 
+    #[test]
+    fn test_ready_tasks_after_blocker_closed() {
+        let tmp = TempDir::new().unwrap();
+        let path = tmp.path().join("tasks.jsonl");
+        let mut store = TaskStore::load(&path).unwrap();
+
+        let blocker = Task::new("Blocker".to_string(), 1);
+        let blocker_id = blocker.id.clone();
+        store.add(blocker);
+
+        let mut blocked = Task::new("Blocked".to_string(), 1);
+        blocked.blocked_by.push(blocker_id.clone());
+        blocked.blocked_by.push("missing-task".to_string());
+        store.add(blocked);
+
+        let mut unblocked = Task::new("Unblocked".to_string(), 1);
+        unblocked.blocked_by.push(blocker_id.clone());
+        store.add(unblocked);
+
+        store.close(&blocker_id);
+
+        let ready: Vec<_> = store.ready().iter().map(|t| t.title.as_str()).collect();
+        assert_eq!(ready, vec!["Unblocked"]);
+        assert!(
+            store
+                .all()
+                .iter()
+                .all(|t| t.is_ready(store.all()) == ready.contains(&t.title.as_str()))
+        );
+    }
+
     #[test]
     fn test_ensure_deduplicates_by_key() {
         let tmp = TempDir::new().unwrap();
@@ -32,14 +32,21 @@
 //! }
 //! ```
 
+use regex::Regex;
 use serde::{Deserialize, Serialize};
 use std::path::PathBuf;
+use std::sync::LazyLock;
 use std::time::Duration;
 use thiserror::Error;
 
 use crate::executor::{PromptSource, RalphExecutor, ScenarioConfig};
 use crate::models::TestResult;
 
+/// Regex to capture the JSON body of an `<event topic="analyze.complete">` block
+static ANALYZE_COMPLETE_RE: LazyLock<Regex> = LazyLock::new(|| {
+    Regex::new(r#"<event\s+topic="analyze\.complete">([\s\S]*?)</event>"#).unwrap()
+});
+
 /// Errors that can occur during analysis.
 #[derive(Debug, Error)]
 pub enum AnalyzerError {
@@ -569,12 +576,7 @@ hats:
 
     /// Parses the analysis response from Ralph output.
     pub fn parse_analysis_event(&self, output: &str) -> Result<AnalysisResponse, AnalyzerError> {
-        // Look for the analyze.complete event
-        let event_regex =
-            regex::Regex::new(r#"<event\s+topic="analyze\.complete">([\s\S]*?)</event>"#)
-                .map_err(|e| AnalyzerError::ParseError(e.to_string()))?;
-
-        let captures = event_regex
+        let captures = ANALYZE_COMPLETE_RE
             .captures(output)
             .ok_or(AnalyzerError::NoAnalysisEvent)?;
 
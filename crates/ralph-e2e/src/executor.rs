@@ -28,11 +28,17 @@
 //! }
 //! ```
 
+use regex::Regex;
 use serde::{Deserialize, Serialize};
 use std::path::PathBuf;
+use std::sync::LazyLock;
 use std::time::Duration;
 use thiserror::Error;
 
+/// Regex to match iteration markers like `[Iteration 1]`, `Iteration 2`, or `[iter 3]`
+static ITERATION_RE: LazyLock<Regex> =
+    LazyLock::new(|| Regex::new(r"(?i)\[?\s*iter(?:ation)?\s*(\d+)\s*\]?").unwrap());
+
 /// Configuration for a test scenario.
 #[derive(Debug, Clone)]
 pub struct ScenarioConfig {
@@ -411,11 +417,8 @@ impl RalphExecutor {
     ///
     /// Ralph outputs iteration markers like "[Iteration 1]" or similar.
     fn count_iterations(&self, output: &str) -> u32 {
-        // Look for patterns like "[Iteration N]" or "Iteration N" or "[iter N]"
-        let iter_regex = regex::Regex::new(r"(?i)\[?\s*iter(?:ation)?\s*(\d+)\s*\]?").unwrap();
-
         let mut max_iter = 0;
-        for cap in iter_regex.captures_iter(output) {
+        for cap in ITERATION_RE.captures_iter(output) {
             if let Some(num) = cap.get(1)
                 && let Ok(n) = num.as_str().parse::<u32>()
             {
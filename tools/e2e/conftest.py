@@ -22,6 +22,10 @@ from .helpers import TmuxSession, FreezeCapture, LLMJudge, IterationCapture
 pytest_plugins = ("pytest_asyncio",) if pytest_asyncio is not None else ()
 async_fixture = pytest_asyncio.fixture if pytest_asyncio is not None else pytest.fixture
 
+# Upper bound for any single E2E test when pytest-timeout is installed.
+# Generous enough for the longest live-Ralph scenario (~4 minutes of waits).
+DEFAULT_TEST_TIMEOUT_SECS = 600
+
 
 def pytest_configure(config):
     """Configure pytest with custom markers."""
@@ -42,6 +46,63 @@ def pytest_configure(config):
     )
 
 
+def pytest_addoption(parser):
+    """Register E2E command-line options."""
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        default=False,
+        help="run tests marked slow (they drive a live Ralph binary)",
+    )
+
+
+def _selected_by_node_id(config, item) -> bool:
+    """Return True if the command line named this item (or its class) by node id."""
+    for arg in config.args:
+        path, sep, rest = arg.partition("::")
+        if not sep:
+            continue
+        if (config.invocation_params.dir / path).resolve() != item.path:
+            continue
+        suffix = item.nodeid.partition("::")[2]
+        if suffix == rest or suffix.startswith((f"{rest}::", f"{rest}[")):
+            return True
+    return False
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip slow tests unless requested and apply a default per-test timeout.
+
+    Slow tests run with ``--run-slow``, when the ``-m`` expression mentions
+    ``slow``, or when they are named by node id on the command line. The
+    timeout keeps a stuck TUI or judge call from hanging the run.
+    """
+    if not config.getoption("--run-slow") and "slow" not in config.getoption("markexpr"):
+        skip_slow = pytest.mark.skip(reason="slow test: pass --run-slow to run")
+        for item in items:
+            if item.get_closest_marker("slow") is not None and not _selected_by_node_id(
+                config, item
+            ):
+                item.add_marker(skip_slow)
+
+    if not config.pluginmanager.hasplugin("timeout"):
+        return
+
+    # A timeout marker overrides every other pytest-timeout setting, so only
+    # apply the default when the user has not configured one (including
+    # --timeout=0 to disable it for debugging).
+    if (
+        config.getoption("timeout") is not None
+        or config.getini("timeout")
+        or "PYTEST_TIMEOUT" in os.environ
+    ):
+        return
+
+    for item in items:
+        if item.get_closest_marker("timeout") is None:
+            item.add_marker(pytest.mark.timeout(DEFAULT_TEST_TIMEOUT_SECS))
+
+
 @pytest.fixture(scope="session")
 def project_root() -> Path:
     """Get the project root directory."""
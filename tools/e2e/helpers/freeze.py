@@ -1,6 +1,7 @@
 """Freeze terminal capture utilities for TUI validation."""
 
 import asyncio
+import functools
 import subprocess
 import tempfile
 from dataclasses import dataclass
@@ -136,8 +137,9 @@ class FreezeCapture:
             )
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def is_available() -> bool:
-        """Check if freeze CLI is available on the system."""
+        """Check if freeze CLI is available on the system (probed once per process)."""
         try:
             result = subprocess.run(
                 ["freeze", "--version"],
@@ -1,6 +1,7 @@
 """Tmux session management for E2E testing."""
 
 import asyncio
+import functools
 import subprocess
 from dataclasses import dataclass
 from typing import Optional
@@ -150,8 +151,9 @@ class TmuxSession:
         await self.kill()
 
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def is_available() -> bool:
-        """Check if tmux is available on the system."""
+        """Check if tmux is available on the system (probed once per process)."""
         try:
             result = subprocess.run(
                 ["tmux", "-V"],
@@ -23,6 +23,7 @@ from .helpers.llm_judge import IDLE_TIMEOUT_CRITERIA
 @pytest.mark.requires_tmux
 @pytest.mark.requires_freeze
 @pytest.mark.requires_claude
+@pytest.mark.slow
 async def test_idle_timeout_triggers_after_inactivity(
     tmux_session: TmuxSession,
     freeze_capture: FreezeCapture,
@@ -7,6 +7,12 @@ These tests validate that:
 4. Fresh context is provided each iteration (scratchpad re-read)
 5. Exit codes match spec
 
+Expected exit codes:
+- 0 = Completed (LOOP_COMPLETE detected)
+- 1 = Stopped (ConsecutiveFailures, LoopThrashing, or manual stop)
+- 2 = Limit (MaxIterations, MaxRuntime, or MaxCost exceeded)
+- 130 = Interrupted (SIGINT, 128 + 2)
+
 Per AGENTS.md Tenet #1: Fresh Context Is Reliability
 Per AGENTS.md Tenet #2: Backpressure Over Prescription (LLM-as-judge)
 """
@@ -46,6 +52,7 @@ from .helpers.llm_judge import (
 @pytest.mark.requires_tmux
 @pytest.mark.requires_freeze
 @pytest.mark.requires_claude
+@pytest.mark.slow
 async def test_iteration_counter_increments(
     tmux_session: TmuxSession,
     iteration_capture: IterationCapture,
@@ -165,6 +172,7 @@ async def test_iteration_counter_increments(
 @pytest.mark.requires_tmux
 @pytest.mark.requires_freeze
 @pytest.mark.requires_claude
+@pytest.mark.slow
 async def test_max_iterations_exit_code(
     tmux_session: TmuxSession,
     iteration_capture: IterationCapture,
@@ -263,6 +271,7 @@ async def test_max_iterations_exit_code(
 @pytest.mark.requires_tmux
 @pytest.mark.requires_freeze
 @pytest.mark.requires_claude
+@pytest.mark.slow
 async def test_completion_dual_confirmation(
     tmux_session: TmuxSession,
     iteration_capture: IterationCapture,
@@ -345,6 +354,7 @@ async def test_completion_dual_confirmation(
 @pytest.mark.e2e
 @pytest.mark.requires_tmux
 @pytest.mark.requires_claude
+@pytest.mark.slow
 async def test_fresh_context_scratchpad_reread(
     tmux_session: TmuxSession,
     iteration_capture: IterationCapture,
@@ -446,42 +456,6 @@ async def test_fresh_context_scratchpad_reread(
     )
 
 
-# ============================================================================
-# Exit Code Verification Tests
-# ============================================================================
-
-
-@pytest.mark.asyncio
-@pytest.mark.e2e
-@pytest.mark.requires_tmux
-async def test_exit_code_documentation(
-    iteration_evidence_dir: Path,
-):
-    """Document expected exit codes per spec.
-
-    Per spec:
-    - 0 = Completed (LOOP_COMPLETE)
-    - 1 = Stopped/ConsecutiveFailures
-    - 2 = MaxIterations/MaxRuntime/MaxCost
-    - 130 = Interrupted (SIGINT)
-
-    This test documents the expected exit codes for reference.
-    """
-    exit_codes = {
-        0: "Completed - LOOP_COMPLETE detected",
-        1: "Stopped - ConsecutiveFailures, LoopThrashing, or manual stop",
-        2: "Limit - MaxIterations, MaxRuntime, or MaxCost exceeded",
-        130: "Interrupted - SIGINT (128 + 2)",
-    }
-
-    # Save documentation
-    doc_path = iteration_evidence_dir / "exit_codes.json"
-    doc_path.write_text(json.dumps(exit_codes, indent=2))
-
-    # This test always passes - it's documentation
-    assert True
-
-
 # ============================================================================
 # Helper Tests for Infrastructure
 # ============================================================================
@@ -491,13 +465,8 @@ async def test_exit_code_documentation(
 @pytest.mark.e2e
 async def test_iteration_capture_pattern_matching():
     """Test that IterationCapture correctly extracts iteration numbers."""
-    from .helpers.iteration_capture import IterationState
-    import re
-
     # Test pattern matching via IterationState.from_content()
     # TUI header format is [iter N/M] where N is current and M is total
-    ITER_PATTERN = re.compile(r'\[iter\s+(\d+)(?:/\d+)?\]')
-
     content_samples = [
         ("[iter 1/3] 00:05 | 🔨 Build | ▶ auto", 1, "00:05", "auto"),
         ("[iter 2/5] 01:23 | 🔧 Test | ▶ auto", 2, "01:23", "auto"),
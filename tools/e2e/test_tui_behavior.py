@@ -156,7 +156,8 @@ async def test_tui_shows_output_in_real_time(
     await tmux_session.send_keys(cmd)
 
     # Wait for TUI to initialize
-    await asyncio.sleep(3)
+    if not await tmux_session.wait_for_alternate_screen(timeout=30.0):
+        await asyncio.sleep(3)
 
     # Capture multiple times during generation
     captures = []
@@ -230,7 +231,8 @@ async def test_tui_navigation_during_output(
     await tmux_session.send_keys(cmd)
 
     # Wait for TUI to show iteration 1
-    await asyncio.sleep(5)
+    if not await tmux_session.wait_for_alternate_screen(timeout=30.0):
+        await asyncio.sleep(5)
 
     # Try to reach iteration 2 (may or may not happen depending on how Claude responds)
     capture = await iteration_capture.wait_for_iteration(2, timeout=60)
@@ -421,7 +423,8 @@ async def test_tui_ctrl_c_termination(
     await tmux_session.send_keys(cmd)
 
     # Wait for TUI to initialize
-    await asyncio.sleep(3)
+    if not await tmux_session.wait_for_alternate_screen(timeout=30.0):
+        await asyncio.sleep(3)
 
     # Send Ctrl+C
     await tmux_session.send_keys("C-c", enter=False)
@@ -165,6 +165,7 @@ def rerun_benchmark_in_repo_venv() -> bool:
         "pytest",
         "-q",
         "-s",
+        "--run-slow",
         f"{Path(__file__)}::test_tui_rich_output_benchmark",
     ]
     result = subprocess.run(
@@ -310,6 +311,7 @@ async def run_tui_capture(
 @pytest.mark.e2e
 @pytest.mark.requires_tmux
 @pytest.mark.requires_claude
+@pytest.mark.slow
 def test_tui_rich_output_benchmark(ralph_binary: Path):
     """Benchmark rich TUI output for a deterministic controlled-adapter scenario."""
     if not TmuxSession.is_available():